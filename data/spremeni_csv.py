@@ -1,13 +1,270 @@
 import csv
+import itertools
+import os
+
+# Pandas je opcijski - brez njega se uporabi modul csv
+PANDAS_AVAILABLE = False
+PYARROW_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    pass
+
+# PyArrow (opcijsko) bere CSV večnitno in precej hitreje od privzetega parserja
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pass
+
+# Število vrstic, ki jih naenkrat obdelamo pri pretočnem branju CSV
+CHUNK_SIZE = 65536
+
+# Konec vrstice v zapisanih CSV datotekah (enako kot privzeto piše modul csv)
+LINE_TERMINATOR = '\r\n'
+
+# Vrednosti logičnih stolpcev (Eulerjev, drevo, dvodelen, ...)
+BOOL_VALUES = ['False', 'True']
+
+def read_columns(path):
+    """Vrne imena stolpcev tabele, ne da bi prebrali vse podatke."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.feather') and not PYARROW_AVAILABLE:
+        # Brez PyArrow shemo dobimo le tako, da pandas prebere celotno tabelo
+        df = pd.read_parquet(path) if ext == '.parquet' else pd.read_feather(path)
+        return list(df.columns)
+    if ext == '.parquet':
+        return pa_parquet.read_schema(path).names
+    if ext == '.feather':
+        return pa.ipc.open_file(path).schema.names
+    with open(path, 'r', newline='') as f:
+        return next(csv.reader(f))
+
+def iter_csv_rows(reader, n_fields):
+    """
+    Vrne vrstice iz csv.reader tako kot csv.DictReader/DictWriter: prazne vrstice
+    preskoči, krajše dopolni s praznimi polji, pri vrstici z več polji kot glava
+    (npr. dve zliti vrstici) pa sproži ValueError.
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) > n_fields:
+            raise ValueError(f"Vrstica {reader.line_num} ima {len(row)} polj, glava pa {n_fields}.")
+        row.extend([''] * (n_fields - len(row)))
+        yield row
+
+def check_row_lengths(path):
+    """Preveri, da nobena vrstica CSV nima več polj kot glava (pandas bi jih tiho zavrgel)."""
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        n_fields = len(next(reader))
+        for _ in iter_csv_rows(reader, n_fields):
+            pass
+
+def read_csv_chunks(path, columns, skip_rows=0):
+    """Bere CSV s pandas po CHUNK_SIZE vrstic; prvih skip_rows podatkovnih vrstic preskoči."""
+    check_row_lengths(path)
+    dtypes = {col: str for col in columns}
+    return pd.read_csv(path, usecols=columns, dtype=dtypes, keep_default_na=False,
+                       skiprows=range(1, skip_rows + 1), chunksize=CHUNK_SIZE)
+
+def iter_empty_chunks(path):
+    """
+    Bere tabelo po kosih brez stolpcev - vsak kos ima le pravo število vrstic.
+    Uporabi se, ko ne ostane noben stolpec za branje.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.feather') and not PYARROW_AVAILABLE:
+        df = pd.read_parquet(path) if ext == '.parquet' else pd.read_feather(path)
+        yield pd.DataFrame(index=pd.RangeIndex(len(df)))
+    elif ext == '.parquet':
+        yield pd.DataFrame(index=pd.RangeIndex(pa_parquet.read_metadata(path).num_rows))
+    elif ext == '.feather':
+        reader = pa.ipc.open_file(path)
+        n_rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        yield pd.DataFrame(index=pd.RangeIndex(n_rows))
+    else:
+        with open(path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            while True:
+                n_rows = sum(1 for _ in itertools.islice(reader, CHUNK_SIZE))
+                if n_rows == 0:
+                    break
+                yield pd.DataFrame(index=pd.RangeIndex(n_rows))
+
+def iter_table_chunks(path, columns):
+    """
+    Bere tabelo po kosih glede na končnico datoteke (.csv, .parquet ali .feather).
+    CSV se bere pretočno (po CHUNK_SIZE vrstic), tako da poraba pomnilnika ni odvisna
+    od velikosti datoteke; vse vrednosti ostanejo besedilo (npr. 'inf', 'True' ali
+    '0.000000000000000' ostanejo nespremenjeni). Parquet in Feather se prebereta v celoti.
+    
+    Prebrani so samo stolpci iz seznama columns (v vrstnem redu datoteke), ostali se
+    sploh ne razčlenjujejo. Tip je podan vnaprej (niz), zato parser tipov ne ugiba.
+    """
+    if not columns:
+        # Prazen seznam stolpcev PyArrow (include_columns) in pandas (read_feather)
+        # razumeta kot "vsi stolpci", zato vrstice le preštejemo
+        yield from iter_empty_chunks(path)
+        return
+    
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.parquet':
+        yield pd.read_parquet(path, columns=columns)
+    elif ext == '.feather':
+        yield pd.read_feather(path, columns=columns)
+    elif PYARROW_AVAILABLE:
+        # engine='pyarrow' v pandas najprej ugiba tipe ('0' -> '0.0'), zato vse
+        # stolpce eksplicitno preberemo kot nize
+        convert_options = pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in columns},
+            include_columns=columns,
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False
+        )
+        # PyArrow zavrne vsako vrstico z napačnim številom polj; zapomnimo si, ali je
+        # bila vrstica prekratka (npr. v grafi_oblika.csv)
+        short_rows = []
+        def invalid_row_handler(row):
+            if row.actual_columns < row.expected_columns:
+                short_rows.append(row.text)
+            return 'error'
+        parse_options = pa_csv.ParseOptions(invalid_row_handler=invalid_row_handler)
+        
+        n_rows = 0
+        try:
+            for batch in pa_csv.open_csv(path, parse_options=parse_options,
+                                         convert_options=convert_options):
+                chunk = batch.to_pandas()
+                n_rows += len(chunk)
+                yield chunk
+        except pa.ArrowInvalid:
+            # Manjkajoča polja pandas izpolni s praznimi nizi - nadaljuj z njim;
+            # predolge vrstice (in druge napake) pa so napaka
+            if not short_rows:
+                raise
+            yield from read_csv_chunks(path, columns, skip_rows=n_rows)
+    else:
+        yield from read_csv_chunks(path, columns)
+
+def encode_bool_columns(df):
+    """
+    Stolpce, ki vsebujejo samo 'True'/'False', pretvori v kategorični tip.
+    Parquet in Feather jih nato shranita s slovarskim kodiranjem (int8 kode namesto nizov).
+    """
+    bool_dtype = pd.CategoricalDtype(BOOL_VALUES)
+    for col in df.columns:
+        values = df[col]
+        if len(values) > 0 and values.dtype != bool_dtype and values.isin(BOOL_VALUES).all():
+            df[col] = values.astype(bool_dtype)
+    return df
+
+def write_table(df, path):
+    """Zapiše tabelo glede na končnico datoteke (.csv, .parquet ali .feather)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.feather'):
+        encode_bool_columns(df)
+    
+    if ext == '.parquet':
+        df.to_parquet(path, index=False, compression='zstd')
+    elif ext == '.feather':
+        df.to_feather(path)
+    else:
+        df.to_csv(path, index=False, lineterminator=LINE_TERMINATOR)
+
+def write_csv_chunk(chunk, f):
+    """
+    Zapiše vrstice kosa tabele (brez glave) v odprto binarno CSV datoteko.
+    
+    Če je na voljo PyArrow, kos zapiše njegov (C++) CSV pisalnik brez narekovajev,
+    tako da je datoteka enaka kot pri pandas. Kos z vrednostmi, ki potrebujejo
+    narekovaje (npr. vejice v stolpcu 'povezave'), zapiše pandas. Obe poti pišeta
+    vrstice s koncem LINE_TERMINATOR.
+    """
+    # Tabela PyArrow brez stolpcev nima vrstic, eno samo prazno polje pa zapiše kot
+    # prazno vrstico (pandas in modul csv kot ""), zato take kose zapiše pandas
+    if PYARROW_AVAILABLE and len(chunk.columns) > 1:
+        write_options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+        sink = pa.BufferOutputStream()
+        try:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            pa_csv.write_csv(table, sink, write_options=write_options)
+        except pa.ArrowInvalid:
+            pass
+        else:
+            # PyArrow piše '\n'; vrednosti z novo vrstico brez narekovajev ne more
+            # zapisati (ArrowInvalid), zato so vsi '\n' v izhodu konci vrstic
+            f.write(sink.getvalue().to_pybytes().replace(b'\n', LINE_TERMINATOR.encode()))
+            return
+    
+    chunk.to_csv(f, index=False, header=False, encoding='utf-8', lineterminator=LINE_TERMINATOR)
+
+def write_table_chunks(chunks, path, columns):
+    """
+    Zapiše kose tabele v datoteko in vrne število zapisanih vrstic.
+    Piše se v začasno datoteko, zato sta vhodna in izhodna datoteka lahko ista.
+    """
+    root, ext = os.path.splitext(path)
+    tmp_path = f"{root}.tmp{ext}"
+    n_rows = 0
+    
+    try:
+        if ext.lower() in ('.parquet', '.feather'):
+            frames = list(chunks)
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+            write_table(df, tmp_path)
+            n_rows = len(df)
+        else:
+            with open(tmp_path, 'wb') as f:
+                # Glavo vedno zapiše pandas (PyArrow bi imena stolpcev dal v narekovaje)
+                pd.DataFrame(columns=columns).to_csv(f, index=False, encoding='utf-8',
+                                                     lineterminator=LINE_TERMINATOR)
+                for chunk in chunks:
+                    write_csv_chunk(chunk, f)
+                    n_rows += len(chunk)
+    except BaseException:
+        # Napaka sredi pisanja (npr. pri branju kosa) - ne puščaj začasne datoteke
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    os.replace(tmp_path, path)
+    return n_rows
+
+def insert_empty_columns(chunks, columns, column_names):
+    """
+    V vsak kos (prebran brez stolpcev column_names) na mestu vstavi prazne stolpce
+    column_names na njihova prvotna mesta v seznamu columns.
+    """
+    positions = sorted({columns.index(col): col for col in column_names}.items())
+    for chunk in chunks:
+        for position, col in positions:
+            chunk.insert(position, col, '')
+        yield chunk
+
+def is_csv_only(*paths):
+    """Preveri, ali so vse datoteke CSV (brez pandas podpiramo samo CSV)."""
+    for path in paths:
+        if os.path.splitext(path)[1].lower() != '.csv':
+            print(f"Format datoteke '{path}' zahteva knjižnico pandas (pip install pandas pyarrow).")
+            return False
+    return True
 
 def clear_column(csv_file, column_name, output_file=None):
     """
     Izbriše vse vrednosti v določenem stolpcu CSV datoteke.
     
     Args:
-        csv_file: Pot do vhodne CSV datoteke
+        csv_file: Pot do vhodne datoteke (.csv, .parquet ali .feather)
         column_name: Ime stolpca, ki ga želimo izprazniti
-        output_file: Pot do izhodne CSV datoteke (če None, prepiše originalno datoteko)
+        output_file: Pot do izhodne datoteke (če None, prepiše originalno datoteko);
+            format se določi glede na končnico
     
     Primer:
         # Izbriši vrednosti v stolpcu 'hamiltonov' in prepiši originalno datoteko
@@ -20,40 +277,60 @@ def clear_column(csv_file, column_name, output_file=None):
     if output_file is None:
         output_file = csv_file
     
-    # Preberi podatke
-    rows = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
+    if PANDAS_AVAILABLE:
+        columns = read_columns(csv_file)
         
         # Preveri, ali stolpec obstaja
-        if column_name not in fieldnames:
+        if column_name not in columns:
             print(f"Stolpec '{column_name}' ne obstaja v datoteki.")
-            print(f"Obstoječi stolpci: {', '.join(fieldnames)}")
+            print(f"Obstoječi stolpci: {', '.join(columns)}")
             return
         
-        # Preberi vse vrstice in izprazni želeni stolpec
-        for row in reader:
-            row[column_name] = ''  # Nastavi na prazen string
-            rows.append(row)
-    
-    # Zapiši nazaj v datoteko
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        # Stolpca ne beremo, ampak ga v vsakem kosu le vstavimo kot prazen
+        kept_columns = [col for col in columns if col != column_name]
+        chunks = insert_empty_columns(iter_table_chunks(csv_file, kept_columns), columns, [column_name])
+        n_rows = write_table_chunks(chunks, output_file, columns)
+    else:
+        if not is_csv_only(csv_file, output_file):
+            return
+        
+        # Preberi podatke (vrstice kot seznami, brez slovarja za vsako vrstico)
+        with open(csv_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader)
+            
+            # Preveri, ali stolpec obstaja
+            if column_name not in fieldnames:
+                print(f"Stolpec '{column_name}' ne obstaja v datoteki.")
+                print(f"Obstoječi stolpci: {', '.join(fieldnames)}")
+                return
+            
+            rows = list(iter_csv_rows(reader, len(fieldnames)))
+        
+        # Izprazni želeni stolpec po indeksu
+        idx = fieldnames.index(column_name)
+        for row in rows:
+            row[idx] = ''  # Nastavi na prazen string
+        
+        # Zapiši nazaj v datoteko
+        with open(output_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+        n_rows = len(rows)
     
     print(f"✓ Stolpec '{column_name}' izpraznjen v datoteki '{output_file}'")
-    print(f"  Število vrstic: {len(rows)}")
+    print(f"  Število vrstic: {n_rows}")
 
 def clear_multiple_columns(csv_file, column_names, output_file=None):
     """
     Izbriše vse vrednosti v več stolpcih CSV datoteke.
     
     Args:
-        csv_file: Pot do vhodne CSV datoteke
+        csv_file: Pot do vhodne datoteke (.csv, .parquet ali .feather)
         column_names: Seznam imen stolpcev, ki jih želimo izprazniti
-        output_file: Pot do izhodne CSV datoteke (če None, prepiše originalno datoteko)
+        output_file: Pot do izhodne datoteke (če None, prepiše originalno datoteko);
+            format se določi glede na končnico
     
     Primer:
         # Izbriši vrednosti v več stolpcih
@@ -63,44 +340,65 @@ def clear_multiple_columns(csv_file, column_names, output_file=None):
     if output_file is None:
         output_file = csv_file
     
-    # Preberi podatke
-    rows = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
+    if PANDAS_AVAILABLE:
+        columns = read_columns(csv_file)
         
         # Preveri, ali vsi stolpci obstajajo
-        missing_columns = [col for col in column_names if col not in fieldnames]
+        missing_columns = [col for col in column_names if col not in columns]
         if missing_columns:
             print(f"Naslednji stolpci ne obstajajo: {', '.join(missing_columns)}")
-            print(f"Obstoječi stolpci: {', '.join(fieldnames)}")
+            print(f"Obstoječi stolpci: {', '.join(columns)}")
             return
         
-        # Preberi vse vrstice in izprazni želene stolpce
-        for row in reader:
-            for col in column_names:
-                row[col] = ''  # Nastavi na prazen string
-            rows.append(row)
-    
-    # Zapiši nazaj v datoteko
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        # Stolpcev ne beremo, ampak jih v vsakem kosu le vstavimo kot prazne
+        kept_columns = [col for col in columns if col not in column_names]
+        chunks = insert_empty_columns(iter_table_chunks(csv_file, kept_columns), columns, column_names)
+        n_rows = write_table_chunks(chunks, output_file, columns)
+    else:
+        if not is_csv_only(csv_file, output_file):
+            return
+        
+        # Preberi podatke (vrstice kot seznami, brez slovarja za vsako vrstico)
+        with open(csv_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader)
+            
+            # Preveri, ali vsi stolpci obstajajo
+            missing_columns = [col for col in column_names if col not in fieldnames]
+            if missing_columns:
+                print(f"Naslednji stolpci ne obstajajo: {', '.join(missing_columns)}")
+                print(f"Obstoječi stolpci: {', '.join(fieldnames)}")
+                return
+            
+            rows = list(iter_csv_rows(reader, len(fieldnames)))
+        
+        # Izprazni želene stolpce po indeksih
+        indices = [fieldnames.index(col) for col in column_names]
+        for row in rows:
+            for idx in indices:
+                row[idx] = ''  # Nastavi na prazen string
+        
+        # Zapiši nazaj v datoteko
+        with open(output_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+        n_rows = len(rows)
     
     print(f"✓ Stolpci izpraznjeni v datoteki '{output_file}':")
     for col in column_names:
         print(f"  - {col}")
-    print(f"  Število vrstic: {len(rows)}")
+    print(f"  Število vrstic: {n_rows}")
 
 def delete_column(csv_file, column_name, output_file=None):
     """
     Izbriše celoten stolpec iz CSV datoteke (ne samo vrednosti).
     
     Args:
-        csv_file: Pot do vhodne CSV datoteke
+        csv_file: Pot do vhodne datoteke (.csv, .parquet ali .feather)
         column_name: Ime stolpca, ki ga želimo izbrisati
-        output_file: Pot do izhodne CSV datoteke (če None, prepiše originalno datoteko)
+        output_file: Pot do izhodne datoteke (če None, prepiše originalno datoteko);
+            format se določi glede na končnico
     
     Primer:
         # Izbriši celoten stolpec 'hamiltonov'
@@ -110,35 +408,54 @@ def delete_column(csv_file, column_name, output_file=None):
     if output_file is None:
         output_file = csv_file
     
-    # Preberi podatke
-    rows = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames)
+    if PANDAS_AVAILABLE:
+        columns = read_columns(csv_file)
         
         # Preveri, ali stolpec obstaja
-        if column_name not in fieldnames:
+        if column_name not in columns:
             print(f"Stolpec '{column_name}' ne obstaja v datoteki.")
-            print(f"Obstoječi stolpci: {', '.join(fieldnames)}")
+            print(f"Obstoječi stolpci: {', '.join(columns)}")
+            return
+        
+        # Izbranega stolpca sploh ne preberemo
+        remaining_columns = [col for col in columns if col != column_name]
+        chunks = iter_table_chunks(csv_file, remaining_columns)
+        n_rows = write_table_chunks(chunks, output_file, remaining_columns)
+        n_columns = len(remaining_columns)
+    else:
+        if not is_csv_only(csv_file, output_file):
             return
         
-        # Odstrani stolpec iz fieldnames
-        fieldnames.remove(column_name)
+        # Preberi podatke (vrstice kot seznami, brez slovarja za vsako vrstico)
+        with open(csv_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader)
+            
+            # Preveri, ali stolpec obstaja
+            if column_name not in fieldnames:
+                print(f"Stolpec '{column_name}' ne obstaja v datoteki.")
+                print(f"Obstoječi stolpci: {', '.join(fieldnames)}")
+                return
+            
+            rows = list(iter_csv_rows(reader, len(fieldnames)))
         
-        # Preberi vse vrstice brez izbranega stolpca
-        for row in reader:
-            new_row = {k: v for k, v in row.items() if k != column_name}
-            rows.append(new_row)
-    
-    # Zapiši nazaj v datoteko brez izbranega stolpca
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        # Odstrani stolpec po indeksu iz glave in vseh vrstic
+        idx = fieldnames.index(column_name)
+        for row in rows:
+            del row[idx]
+        del fieldnames[idx]
+        
+        # Zapiši nazaj v datoteko brez izbranega stolpca
+        with open(output_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+        n_rows = len(rows)
+        n_columns = len(fieldnames)
     
     print(f"✓ Stolpec '{column_name}' izbrisan iz datoteke '{output_file}'")
-    print(f"  Število vrstic: {len(rows)}")
-    print(f"  Število preostalih stolpcev: {len(fieldnames)}")
+    print(f"  Število vrstic: {n_rows}")
+    print(f"  Število preostalih stolpcev: {n_columns}")
 
 
 # Primer uporabe:
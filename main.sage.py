@@ -89,6 +89,76 @@ def has_missing_properties(row, ignore_fields=['druzina']):
             return True
     return False
 
+@parallel
+def compute_missing_properties(graf_ime, G, props):
+    """
+    Izračuna manjkajoče (prazne ali None) lastnosti grafa G.
+    
+    Ker je funkcija označena z @parallel, jo lahko pokličemo s seznamom
+    argumentov (graf_ime, G, props) in Sage grafe obdela v več procesih hkrati.
+    
+    Returns:
+        dict: Vrstica props z dopolnjenimi lastnostmi
+    """
+    def missing(key):
+        return props.get(key) in ('', None)
+    
+    if missing('alpha'):
+        props['alpha'] = G.independent_set(value_only=True)
+    
+    if missing('alpha_od'):
+        props['alpha_od'] = alpha_od_ilp_correct(G)
+    
+    if missing('alpha^2'):
+        props['alpha^2'] = graph_power(G, _sage_const_2).independent_set(value_only=True)
+
+    if missing("premer"):
+        props["premer"] = get_diameter(G)
+
+    if missing("max_stopnja"):
+        props["max_stopnja"] = get_max_degree(G)
+
+    if missing("min_stopnja"):
+        props["min_stopnja"] = get_min_degree(G)
+    
+    if missing("vse_neparne"):
+        props["vse_neparne"] = all_degrees_odd(G)
+
+    if missing("obseg"):
+        props["obseg"] = get_girth(G)
+    
+    if missing("radij"):
+        props["radij"] = get_radius(G)
+
+    if missing("dvodelen"):
+        props["dvodelen"] = G.is_bipartite()
+
+    if missing("drevo"):
+        props["drevo"] = G.is_tree()
+    
+    if missing("gozd"):
+        props["gozd"] = G.is_forest()
+    
+    if missing("Eulerjev"):
+        props["Eulerjev"] = G.is_eulerian()
+    
+    if missing("kromaticno_stevilo"):
+        props["kromaticno_stevilo"] = get_chromatic_number(G)
+    
+    if missing("gostota"):
+        props["gostota"] = get_density(G)
+
+    if missing("regularen"):
+        props["regularen"] = G.is_regular()
+    
+    if missing("tricikli"):
+        props["tricikli"] = count_triangles(G)
+    
+    if missing("stiricikli"):
+        props["stiricikli"] = count_4cycles(G)
+    
+    return props
+
 # Funkcija za preverjanje lastnosti in shranjevanje
 def analyze_and_save_graphs(graphs, properties_file='data/grafi.csv', graphs_file='data/grafi_oblika.csv'):
     """Preveri lastnosti grafov in shrani rezultate v CSV datoteke"""
@@ -124,9 +194,10 @@ def analyze_and_save_graphs(graphs, properties_file='data/grafi.csv', graphs_fil
     # Pripravi podatke za grafi.csv
     results_dict = {}
     
-    # Najprej dodaj vse obstoječe lastnosti
+    # Najprej dodaj vse obstoječe lastnosti (vrstice so sveže prebrane iz CSV,
+    # zato jih ni treba kopirati)
     for graf_ime, props in existing_properties.items():
-        results_dict[graf_ime] = props.copy()
+        results_dict[graf_ime] = props
     
     # Ustvari slovar grafov za hitrejši dostop
     graphs_dict = {}
@@ -159,16 +230,12 @@ def analyze_and_save_graphs(graphs, properties_file='data/grafi.csv', graphs_fil
     print(f"Obdelujem {total_to_process} grafov (novi + manjkajoče lastnosti)...")
     processed = _sage_const_0 
     
-    # Obdelaj samo grafe, ki potrebujejo obdelavo
-    for i, graf_ime in enumerate(graphs_to_process):
-        processed += _sage_const_1 
-        if processed % _sage_const_10  == _sage_const_0 :
-            percentage = float(_sage_const_100  * processed) / float(total_to_process)
-            print(f"Obdelanih {processed}/{total_to_process} grafov ({percentage:.1f}%)")
-        
-        # Če graf še ni v results_dict, dodaj osnovne podatke
-        if graf_ime not in results_dict:
-            results_dict[graf_ime] = {'graf': graf_ime, 'druzina': ''}
+    # Pripravi grafe za obdelavo
+    tasks = []
+    for graf_ime in graphs_to_process:
+        # Nov graf dobi osnovne podatke, v results_dict pa pride šele, ko so
+        # lastnosti izračunane (sicer bi ga vmesno shranjevanje zapisalo praznega)
+        props = results_dict.get(graf_ime) or {'graf': graf_ime, 'druzina': ''}
         
         # Pridobi graf objekt
         G = None
@@ -177,8 +244,8 @@ def analyze_and_save_graphs(graphs, properties_file='data/grafi.csv', graphs_fil
             G, druzina = graphs_dict[graf_ime]
             # Posodobi družino SAMO če je podana in obstoječa je prazna
             if druzina and druzina != "neznan":
-                if not results_dict[graf_ime].get('druzina') or results_dict[graf_ime]['druzina'] == "neznan":
-                    results_dict[graf_ime]['druzina'] = druzina
+                if not props.get('druzina') or props['druzina'] == "neznan":
+                    props['druzina'] = druzina
         else:
             # Rekonstruiraj graf iz vozlišč in povezav
             graf_data = all_graphs[graf_ime]
@@ -190,66 +257,31 @@ def analyze_and_save_graphs(graphs, properties_file='data/grafi.csv', graphs_fil
             G.add_vertices(vertices)
             G.add_edges(edges)
         
-        # Izračunaj lastnosti - preveri prazne in None vrednosti
-        if 'alpha' not in results_dict[graf_ime] or results_dict[graf_ime].get('alpha') in ('', None):
-            results_dict[graf_ime]['alpha'] = G.independent_set(value_only=True)
-        
-        if 'alpha_od' not in results_dict[graf_ime] or results_dict[graf_ime].get('alpha_od') in ('', None):
-            results_dict[graf_ime]['alpha_od'] = alpha_od_ilp_correct(G)
-        
-        if 'alpha^2' not in results_dict[graf_ime] or results_dict[graf_ime].get('alpha^2') in ('', None):
-            results_dict[graf_ime]['alpha^2'] = graph_power(G, _sage_const_2 ).independent_set(value_only=True)
-
-        if "premer" not in results_dict[graf_ime] or results_dict[graf_ime].get("premer") in ('', None):
-            results_dict[graf_ime]["premer"] = get_diameter(G)
-
-        if "max_stopnja" not in results_dict[graf_ime] or results_dict[graf_ime].get("max_stopnja") in ('', None):
-            results_dict[graf_ime]["max_stopnja"] = get_max_degree(G)
-
-        if "min_stopnja" not in results_dict[graf_ime] or results_dict[graf_ime].get("min_stopnja") in ('', None):
-            results_dict[graf_ime]["min_stopnja"] = get_min_degree(G)
-        
-        if "vse_neparne" not in results_dict[graf_ime] or results_dict[graf_ime].get("vse_neparne") in ('', None):
-            results_dict[graf_ime]["vse_neparne"] = all_degrees_odd(G)
-
-        if "obseg" not in results_dict[graf_ime] or results_dict[graf_ime].get("obseg") in ('', None):
-            results_dict[graf_ime]["obseg"] = get_girth(G)
-        
-        if "radij" not in results_dict[graf_ime] or results_dict[graf_ime].get("radij") in ('', None):
-            results_dict[graf_ime]["radij"] = get_radius(G)
-
-        if "dvodelen" not in results_dict[graf_ime] or results_dict[graf_ime].get("dvodelen") in ('', None):
-            results_dict[graf_ime]["dvodelen"] = G.is_bipartite()
-
-        if "drevo" not in results_dict[graf_ime] or results_dict[graf_ime].get("drevo") in ('', None):
-            results_dict[graf_ime]["drevo"] = G.is_tree()
-        
-        if "gozd" not in results_dict[graf_ime] or results_dict[graf_ime].get("gozd") in ('', None):
-            results_dict[graf_ime]["gozd"] = G.is_forest()
-        
-        if "Eulerjev" not in results_dict[graf_ime] or results_dict[graf_ime].get("Eulerjev") in ('', None):
-            results_dict[graf_ime]["Eulerjev"] = G.is_eulerian()
-        
-        if "kromaticno_stevilo" not in results_dict[graf_ime] or results_dict[graf_ime].get("kromaticno_stevilo") in ('', None):
-            results_dict[graf_ime]["kromaticno_stevilo"] = get_chromatic_number(G)
-        
-        if "gostota" not in results_dict[graf_ime] or results_dict[graf_ime].get("gostota") in ('', None):
-            results_dict[graf_ime]["gostota"] = get_density(G)
-
-        if "regularen" not in results_dict[graf_ime] or results_dict[graf_ime].get("regularen") in ('', None):
-            results_dict[graf_ime]["regularen"] = G.is_regular()
+        tasks.append((graf_ime, G, props))
+    
+    # Lastnosti se računajo vzporedno (@parallel), rezultati pa se zbirajo in
+    # zapisujejo zaporedno v glavnem procesu (vrstni red je vrstni red zaključka)
+    succeeded = _sage_const_0 
+    failed = []
+    for (args, kwds), props in compute_missing_properties(tasks):
+        graf_ime = args[_sage_const_0]
+        processed += _sage_const_1 
+        if processed % _sage_const_10  == _sage_const_0 :
+            percentage = float(_sage_const_100  * processed) / float(total_to_process)
+            print(f"Obdelanih {processed}/{total_to_process} grafov ({percentage:.1f}%)")
         
-        if "tricikli" not in results_dict[graf_ime] or results_dict[graf_ime].get("tricikli") in ('', None):
-            results_dict[graf_ime]["tricikli"] = count_triangles(G)
+        if not isinstance(props, dict):
+            print(f"⚠ Napaka pri izračunu lastnosti grafa {graf_ime}: {props}")
+            failed.append(graf_ime)
+            continue
         
-        if "stiricikli" not in results_dict[graf_ime] or results_dict[graf_ime].get("stiricikli") in ('', None):
-            results_dict[graf_ime]["stiricikli"] = count_4cycles(G)
-
-        fieldnames_set.update(results_dict[graf_ime].keys())
+        results_dict[graf_ime] = props
+        fieldnames_set.update(props.keys())
+        succeeded += _sage_const_1 
     
         # Shrani vsakih 50 grafov
-        if i % _sage_const_50  == _sage_const_0  and i > _sage_const_0 :
-            print(f"Shranjujem vmesne rezultate pri {i} grafih...")
+        if succeeded % _sage_const_50  == _sage_const_0 :
+            print(f"Shranjujem vmesne rezultate pri {succeeded} grafih...")
             results = list(results_dict.values())
             fieldnames = sorted(fieldnames_set)
             priority_fields = ['graf', 'druzina']
@@ -275,7 +307,9 @@ def analyze_and_save_graphs(graphs, properties_file='data/grafi.csv', graphs_fil
             writer.writeheader()
             writer.writerows(results)
     
-    print(f"✓ Končano! Obdelanih {total_to_process} grafov.")
+    print(f"✓ Končano! Obdelanih {succeeded}/{total_to_process} grafov.")
+    if failed:
+        print(f"⚠ Izračun lastnosti ni uspel za {len(failed)} grafov: {', '.join(failed)}")
 
 
 # Primer uporabe:
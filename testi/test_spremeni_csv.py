@@ -0,0 +1,188 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+import spremeni_csv
+
+# Enaka oblika kot data/grafi_oblika.csv: konci vrstic '\r\n', povezave v narekovajih
+GRAFI_OBLIKA = (
+    'graf,vozlisca,povezave\r\n'
+    'G0,"[0, 1]","[(0, 1)]"\r\n'
+    'G1,"[0, 1, 2]","[(0, 1), (1, 2)]"\r\n'
+)
+
+@pytest.fixture(params=['pyarrow', 'pandas', 'csv'])
+def writer(request, monkeypatch):
+    """Poženi test s PyArrow, samo s pandas in samo z modulom csv."""
+    if request.param in ('pandas', 'csv'):
+        monkeypatch.setattr(spremeni_csv, 'PYARROW_AVAILABLE', False)
+    if request.param == 'csv':
+        monkeypatch.setattr(spremeni_csv, 'PANDAS_AVAILABLE', False)
+    return request.param
+
+def write_file(path, text):
+    with open(path, 'w', newline='') as f:
+        f.write(text)
+
+def read_file(path):
+    with open(path, 'r', newline='') as f:
+        return f.read()
+
+def test_clear_column_keeps_crlf(tmp_path, writer):
+    path = tmp_path / 'grafi_oblika.csv'
+    write_file(path, GRAFI_OBLIKA)
+
+    spremeni_csv.clear_column(str(path), 'vozlisca')
+
+    assert read_file(path) == (
+        'graf,vozlisca,povezave\r\n'
+        'G0,,"[(0, 1)]"\r\n'
+        'G1,,"[(0, 1), (1, 2)]"\r\n'
+    )
+
+def test_delete_column_keeps_crlf(tmp_path, writer):
+    path = tmp_path / 'grafi.csv'
+    write_file(path, 'graf,druzina,alpha\r\nG0,pot,1\r\nG1,cikel,2\r\n')
+
+    spremeni_csv.delete_column(str(path), 'druzina')
+
+    assert read_file(path) == 'graf,alpha\r\nG0,1\r\nG1,2\r\n'
+
+def test_header_without_rows(tmp_path, writer):
+    path = tmp_path / 'grafi.csv'
+    write_file(path, 'graf,druzina,alpha\r\n')
+
+    spremeni_csv.clear_column(str(path), 'alpha')
+
+    assert read_file(path) == 'graf,druzina,alpha\r\n'
+
+def test_clear_column_ragged_rows(tmp_path, writer):
+    # Vrstica z manj polji (kot v data/grafi_oblika.csv) dobi prazna polja
+    path = tmp_path / 'grafi_oblika.csv'
+    write_file(path, GRAFI_OBLIKA + 'G2,"[0]"\r\n' + 'G3,"[0, 1]","[(0, 1)]"\r\n')
+
+    spremeni_csv.clear_column(str(path), 'vozlisca')
+
+    assert read_file(path) == (
+        'graf,vozlisca,povezave\r\n'
+        'G0,,"[(0, 1)]"\r\n'
+        'G1,,"[(0, 1), (1, 2)]"\r\n'
+        'G2,,\r\n'
+        'G3,,"[(0, 1)]"\r\n'
+    )
+
+def test_delete_column_ragged_rows(tmp_path, writer):
+    path = tmp_path / 'grafi_oblika.csv'
+    write_file(path, GRAFI_OBLIKA + 'G2\r\n')
+
+    spremeni_csv.delete_column(str(path), 'povezave')
+
+    assert read_file(path) == 'graf,vozlisca\r\nG0,"[0, 1]"\r\nG1,"[0, 1, 2]"\r\nG2,\r\n'
+
+def test_long_row_raises(tmp_path, writer):
+    # Zliti vrstici (kot vrstica 23883 v data/grafi.csv) - podatkov ne smemo izgubiti
+    path = tmp_path / 'grafi.csv'
+    text = 'graf,druzina,alpha\r\nG0,pot,1\r\nG1,cikel,2G2,pot,3\r\n'
+    write_file(path, text)
+
+    with pytest.raises(ValueError):
+        spremeni_csv.clear_column(str(path), 'alpha')
+
+    assert read_file(path) == text
+    assert list(tmp_path.iterdir()) == [path]
+
+def test_long_row_raises_in_pyarrow(tmp_path, monkeypatch):
+    # Predolge vrstice ne preda pandas, napako javi že PyArrow
+    def read_csv_chunks(*args, **kwargs):
+        raise AssertionError('pandas ne bi smel brati datoteke')
+    monkeypatch.setattr(spremeni_csv, 'read_csv_chunks', read_csv_chunks)
+    path = tmp_path / 'grafi.csv'
+    write_file(path, 'graf,alpha\r\nG0,1\r\nG1,2,G2,3\r\n')
+
+    with pytest.raises(spremeni_csv.pa.ArrowInvalid):
+        list(spremeni_csv.iter_table_chunks(str(path), ['graf', 'alpha']))
+
+def test_blank_lines_skipped(tmp_path, writer):
+    # data/rezultati.csv se konča s prazno vrstico
+    path = tmp_path / 'rezultati.csv'
+    write_file(path, 'graf,alpha,alpha_od\r\nG0,1,2\r\n\r\nG1,3,4\r\n\r\n')
+
+    spremeni_csv.clear_column(str(path), 'alpha')
+
+    assert read_file(path) == 'graf,alpha,alpha_od\r\nG0,,2\r\nG1,,4\r\n'
+
+def test_ragged_rows_after_first_chunk(tmp_path):
+    # PyArrow bere po blokih (1 MB) in napako javi šele v bloku z napačno vrstico;
+    # že prebrane vrstice se ne smejo ponoviti ali izgubiti
+    path = tmp_path / 'grafi.csv'
+    n = 200000
+    rows = ''.join(f'G{i},{i}\r\n' for i in range(n))
+    write_file(path, 'graf,alpha\r\n' + rows + f'G{n}\r\n')
+
+    chunks = list(spremeni_csv.iter_table_chunks(str(path), ['graf', 'alpha']))
+
+    df = spremeni_csv.pd.concat(chunks, ignore_index=True)
+    assert list(df['graf']) == [f'G{i}' for i in range(n + 1)]
+    assert list(df['alpha']) == [str(i) for i in range(n)] + ['']
+
+def test_clear_all_columns(tmp_path, writer):
+    path = tmp_path / 'grafi.csv'
+    write_file(path, 'graf,alpha\r\nG0,1\r\nG1,2\r\n')
+
+    spremeni_csv.clear_multiple_columns(str(path), ['graf', 'alpha'])
+
+    assert read_file(path) == 'graf,alpha\r\n,\r\n,\r\n'
+
+def test_clear_only_column(tmp_path, writer):
+    path = tmp_path / 'grafi.csv'
+    write_file(path, 'a\r\n1\r\n2\r\n')
+
+    spremeni_csv.clear_column(str(path), 'a')
+
+    assert read_file(path) == 'a\r\n""\r\n""\r\n'
+
+def test_delete_only_column(tmp_path, writer):
+    path = tmp_path / 'grafi.csv'
+    write_file(path, 'a\r\n1\r\n2\r\n')
+
+    spremeni_csv.delete_column(str(path), 'a')
+
+    assert read_file(path) == '\r\n\r\n\r\n'
+
+@pytest.mark.parametrize('ext', ['.parquet', '.feather'])
+def test_clear_only_column_binary(tmp_path, ext):
+    path = str(tmp_path / f'grafi{ext}')
+    spremeni_csv.write_table(spremeni_csv.pd.DataFrame({'a': ['1', '2']}), path)
+
+    spremeni_csv.clear_column(path, 'a')
+
+    df = next(spremeni_csv.iter_table_chunks(path, ['a']))
+    assert list(df['a']) == ['', '']
+
+@pytest.mark.parametrize('column', ['a', 'b'])
+def test_parquet_without_pyarrow(tmp_path, monkeypatch, column):
+    # pandas ima lahko drug pogon za Parquet (fastparquet), moduli PyArrow pa niso uvoženi
+    path = str(tmp_path / 'grafi.parquet')
+    spremeni_csv.write_table(spremeni_csv.pd.DataFrame({'a': ['1', '2']}), path)
+    monkeypatch.setattr(spremeni_csv, 'PYARROW_AVAILABLE', False)
+    monkeypatch.delattr(spremeni_csv, 'pa')
+    monkeypatch.delattr(spremeni_csv, 'pa_parquet')
+
+    spremeni_csv.clear_column(path, column)
+
+    assert spremeni_csv.read_columns(path) == ['a']
+    assert len(spremeni_csv.pd.read_parquet(path)) == 2
+
+@pytest.mark.parametrize('name', ['grafi.csv', 'grafi.parquet'])
+def test_failed_write_removes_tmp_file(tmp_path, name):
+    def chunks():
+        yield spremeni_csv.pd.DataFrame({'graf': ['G0'], 'alpha': ['1']})
+        raise ValueError('napaka pri branju')
+
+    with pytest.raises(ValueError):
+        spremeni_csv.write_table_chunks(chunks(), str(tmp_path / name), ['graf', 'alpha'])
+
+    assert list(tmp_path.iterdir()) == []